@@ -33,6 +33,9 @@ typedef struct {
   int quiet;                /* Suppress stats output */
 } libplumbr_config_t;
 
+/* Flags for libplumbr_new_ex */
+#define LIBPLUMBR_FLAT_DFA 0x1u /* Build full pattern DFA as a flat table */
+
 /* Statistics */
 typedef struct {
   size_t lines_processed;
@@ -50,6 +53,24 @@ typedef struct {
  */
 libplumbr_t *libplumbr_new(const libplumbr_config_t *config);
 
+/*
+ * Create a new PlumbrC instance with extra build options
+ *
+ * Same as libplumbr_new, plus a bitmask of LIBPLUMBR_* flags. Options live
+ * here rather than in libplumbr_config_t so the config struct keeps its
+ * layout across releases.
+ *
+ * LIBPLUMBR_FLAT_DFA: store every automaton state as a full 256-entry
+ *   transition table instead of the compressed default. Costs memory (up
+ *   to 512 bytes per state) and construction time.
+ *
+ * config: Configuration options (NULL for defaults)
+ * flags: Bitwise OR of LIBPLUMBR_* flags (0 = same as libplumbr_new)
+ * Returns: Handle or NULL on error (including unknown flags)
+ */
+libplumbr_t *libplumbr_new_ex(const libplumbr_config_t *config,
+                              unsigned int flags);
+
 /*
  * Redact a single line
  *
@@ -130,6 +151,55 @@ const char *libplumbr_version(void);
 char *libplumbr_redact_buffer(libplumbr_t *p, const char *input,
                               size_t input_len, size_t *output_len);
 
+/*
+ * Redact a newline-separated buffer into caller-provided memory
+ *
+ * Same line handling as libplumbr_redact_buffer, but writes into a buffer
+ * owned by the caller, so bindings can reuse one output buffer across calls
+ * instead of paying a malloc/free per call. The output is not
+ * null-terminated. As with libplumbr_redact_buffer, a line longer than the
+ * maximum line size (64KB) does not fail the call; if it contains a match,
+ * its redacted output is truncated to that size.
+ *
+ * p: PlumbrC handle
+ * input: Newline-separated input buffer
+ * input_len: Length of input buffer
+ * output: Destination buffer
+ * output_cap: Capacity of destination buffer
+ * output_len: Receives output length; if the buffer was too small,
+ *             receives the capacity required instead
+ *
+ * Returns: 0 on success, 1 if output_cap is too small (nothing is counted
+ *          in the stats; grow to *output_len and retry), -1 on error
+ */
+int libplumbr_redact_into(libplumbr_t *p, const char *input, size_t input_len,
+                          char *output, size_t output_cap, size_t *output_len);
+
+/*
+ * Redact a single line into caller-provided memory
+ *
+ * Same input handling as libplumbr_redact: the whole input is one unit,
+ * newlines included, so patterns can match across them. Writes into a
+ * buffer owned by the caller instead of returning a malloc'd string. The
+ * output is not null-terminated.
+ *
+ * p: PlumbrC handle
+ * input: Input string (does not need to be null-terminated)
+ * input_len: Length of input string
+ * output: Destination buffer
+ * output_cap: Capacity of destination buffer
+ * output_len: Receives output length; if the buffer was too small,
+ *             receives the capacity required instead
+ *
+ * Returns: 0 on success, 1 if output_cap is too small (nothing is counted
+ *          in the stats; grow to *output_len and retry; any buffer of at
+ *          least 64KB is always large enough), -1 on error or if input
+ *          is longer than the maximum line size (64KB)
+ */
+int libplumbr_redact_line_into(libplumbr_t *p, const char *input,
+                               size_t input_len, char *output,
+                               size_t output_cap, size_t *output_len);
+
 /*
  * Free a string returned by libplumbr_redact or libplumbr_redact_buffer.
  * Use this instead of free() when calling from FFI (Python, Go, etc.)
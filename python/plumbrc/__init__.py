@@ -11,8 +11,17 @@ Example:
     'api_key=[REDACTED:api_key]'
 """
 
-from plumbrc._plumbr import Plumbr
+from plumbrc._plumbr import Plumbr, PlumbrStats
+from plumbrc._pool import PlumbrPool, get_pooled
 from plumbrc.exceptions import PlumbrError, LibraryNotFoundError, RedactionError
 
 __version__ = "1.0.2"
-__all__ = ["Plumbr", "PlumbrError", "LibraryNotFoundError", "RedactionError"]
+__all__ = [
+    "Plumbr",
+    "PlumbrStats",
+    "PlumbrPool",
+    "get_pooled",
+    "PlumbrError",
+    "LibraryNotFoundError",
+    "RedactionError",
+]
@@ -0,0 +1,116 @@
+"""
+Reusable output buffer and call loop shared by both bindings.
+
+The ctypes (plumbrc._plumbr) and cffi (plumbrc._plumbr_cffi) call paths
+subclass OutputBuffer, so both normalize input, grow, retry and release
+the buffer the same way. A subclass only supplies the backend pieces:
+the two redaction functions, the output-length cell and how to wrap a
+buffer as a C pointer.
+"""
+
+from typing import Optional
+
+# Smallest reusable output buffer kept per handle
+OUTBUF_MIN = 64 * 1024
+
+# A buffer grown past this for one large call is released afterwards
+# rather than pinned for the rest of the instance's life
+OUTBUF_KEEP_MAX = 8 * 1024 * 1024
+
+
+class OutputBuffer:
+    """
+    Per-handle redaction calls into a reusable output buffer.
+
+    Subclasses set, in __init__:
+        _handle: handle argument passed to C
+        _out_len: one-element size_t array C writes the output length to
+        _redact_into: libplumbr_redact_into
+        _redact_line_into: libplumbr_redact_line_into
+    and implement _wrap_output() and _wrap_input().
+    """
+
+    __slots__ = ("_handle", "_out_len", "_redact_into", "_redact_line_into",
+                 "_outbuf", "_outbuf_c")
+
+    def __init__(self):
+        self._outbuf = bytearray()
+        self._outbuf_c = None
+
+    def _wrap_output(self, buf: bytearray):
+        """Return a C char pointer into buf without copying."""
+        raise NotImplementedError
+
+    def _wrap_input(self, data, n: int):
+        """Return a C view of n bytes of contiguous buffer data."""
+        raise NotImplementedError
+
+    def _reserve(self, size: int) -> None:
+        """Replace the output buffer with one of at least size bytes."""
+        size = max(size, OUTBUF_MIN)
+        self._outbuf = bytearray(size)
+        self._outbuf_c = self._wrap_output(self._outbuf)
+
+    def _release_large(self) -> None:
+        """Drop a buffer grown past OUTBUF_KEEP_MAX; the next call re-reserves."""
+        if len(self._outbuf) > OUTBUF_KEEP_MAX:
+            self._outbuf = bytearray()
+            self._outbuf_c = None
+
+    def _run(self, fn, data, n: int) -> Optional[int]:
+        """
+        Call fn into the output buffer until the result fits.
+
+        Returns the output length, or None on failure. On shortfall the
+        buffer is grown to the size C reported and the call retried.
+        """
+        if len(self._outbuf) < 2 * n + 1:
+            self._reserve(2 * n + 1)
+        out_len = self._out_len
+        while True:
+            rc = fn(self._handle, data, n, self._outbuf_c, len(self._outbuf),
+                    out_len)
+            if rc == 0:
+                return out_len[0]
+            if rc != 1:
+                self._release_large()
+                return None
+            self._reserve(out_len[0])
+
+    def redact_buffer_view(self, data) -> Optional[memoryview]:
+        """
+        Redact a newline-separated buffer into the reusable output buffer.
+
+        Accepts any buffer-protocol object. Returns a view that stays valid
+        until the next call, or None on failure.
+        """
+        if type(data) is bytes:
+            n = len(data)
+        else:
+            view = memoryview(data)
+            n = view.nbytes
+            if view.c_contiguous:
+                data = self._wrap_input(data, n)
+            else:
+                # C needs one contiguous span; strided views are copied once
+                data = view.tobytes()
+        out_len = self._run(self._redact_into, data, n)
+        if out_len is None:
+            return None
+        # An outstanding view keeps a released buffer alive itself
+        view = memoryview(self._outbuf)[:out_len]
+        self._release_large()
+        return view
+
+    def redact_buffer(self, data) -> Optional[bytes]:
+        """Redact a newline-separated buffer; returns None on failure."""
+        view = self.redact_buffer_view(data)
+        return None if view is None else view.tobytes()
+
+    def redact_line(self, data: bytes) -> Optional[bytes]:
+        """Redact data as one unit, newlines included; returns None on failure."""
+        out_len = self._run(self._redact_line_into, data, len(data))
+        if out_len is None:
+            return None
+        # Input is capped at 64KB, so this buffer never needs releasing
+        return memoryview(self._outbuf)[:out_len].tobytes()
@@ -2,14 +2,17 @@
 Core ctypes wrapper for libplumbr.so
 
 This module provides the low-level interface to the PlumbrC C library.
+When cffi is installed the per-call redaction entry points go through
+plumbrc._plumbr_cffi instead (set PLUMBRC_NO_CFFI=1 to force ctypes).
 """
 
 import ctypes
 import os
-from pathlib import Path
-from typing import Optional, Dict, List
-from ctypes import c_char_p, c_size_t, c_int, c_void_p, POINTER, Structure
+from collections import OrderedDict
+from typing import Optional, Dict, List, Sequence, Union
+from ctypes import c_char, c_char_p, c_size_t, c_int, c_void_p, POINTER, Structure
 
+from plumbrc._buffers import OutputBuffer
 from plumbrc.exceptions import LibraryNotFoundError, RedactionError
 
 
@@ -25,6 +28,10 @@ class PlumbrConfig(Structure):
     ]
 
 
+# libplumbr_new_ex flags (see libplumbr.h)
+_FLAT_DFA = 0x1
+
+
 class PlumbrStats(Structure):
     """Statistics from redaction operations."""
     _fields_ = [
@@ -34,6 +41,30 @@ class PlumbrStats(Structure):
         ("bytes_processed", c_size_t),
         ("elapsed_seconds", ctypes.c_double),
     ]
+    
+    def _asdict(self) -> Dict[str, Union[int, float]]:
+        """Return the fields as a dictionary, like a named tuple."""
+        return {name: getattr(self, name) for name, _ in self._fields_}
+    
+    def __repr__(self):
+        """String representation."""
+        fields = ", ".join(f"{k}={v!r}" for k, v in self._asdict().items())
+        return f"PlumbrStats({fields})"
+
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Remembers where the library was found so warm imports stat one path
+_LIBCACHE = os.path.join(_PACKAGE_DIR, ".libcache")
+
+
+def _write_libcache(path: str) -> None:
+    try:
+        with open(_LIBCACHE, "w") as f:
+            f.write(path)
+    except OSError:
+        # Read-only install; the full search just runs every time
+        pass
 
 
 def _find_library() -> ctypes.CDLL:
@@ -41,9 +72,14 @@ def _find_library() -> ctypes.CDLL:
     Find and load libplumbr.so from various locations.
     
     Search order:
-    1. Bundled library (in package directory)
-    2. Build directory (for development)
-    3. System library paths (/usr/local/lib, /usr/lib)
+    1. PLUMBRC_LIB environment variable (explicit path, no fallback)
+    2. Bundled library (in package directory)
+    3. Build directory (for development)
+    4. System library paths (/usr/local/lib, /usr/lib)
+    
+    The path found is remembered in plumbrc/.libcache. A later import
+    loads it after stat-ing only the locations ranked above it, so a newly
+    installed bundled or development library still takes precedence.
     
     Returns:
         Loaded ctypes.CDLL object
@@ -51,64 +87,169 @@ def _find_library() -> ctypes.CDLL:
     Raises:
         LibraryNotFoundError: If library cannot be found
     """
-    # Get package directory
-    package_dir = Path(__file__).parent
+    env_path = os.environ.get("PLUMBRC_LIB")
+    if env_path:
+        try:
+            return ctypes.CDLL(env_path)
+        except OSError as e:
+            raise LibraryNotFoundError(
+                f"Could not load PLUMBRC_LIB={env_path}: {e}"
+            ) from e
     
     # Search paths in order of preference
     search_paths = [
         # Bundled with package (for binary wheels)
-        package_dir / "lib" / "libplumbr.so",
+        os.path.join(_PACKAGE_DIR, "lib", "libplumbr.so"),
         # Development build
-        package_dir.parent.parent / "build" / "lib" / "libplumbr.so",
+        os.path.join(os.path.dirname(os.path.dirname(_PACKAGE_DIR)),
+                     "build", "lib", "libplumbr.so"),
         # System paths
-        Path("/usr/local/lib/libplumbr.so"),
-        Path("/usr/lib/libplumbr.so"),
-        Path("/usr/lib/x86_64-linux-gnu/libplumbr.so"),
+        "/usr/local/lib/libplumbr.so",
+        "/usr/lib/libplumbr.so",
+        "/usr/lib/x86_64-linux-gnu/libplumbr.so",
     ]
     
+    try:
+        with open(_LIBCACHE) as f:
+            cached = f.read().strip()
+    except OSError:
+        cached = None
+    
+    # Only one of our own candidates, and only while nothing ranked above it
+    # has appeared; otherwise fall through to the full search
+    if cached in search_paths:
+        higher = search_paths[:search_paths.index(cached)]
+        if os.path.isfile(cached) and not any(map(os.path.isfile, higher)):
+            try:
+                return ctypes.CDLL(cached)
+            except OSError:
+                pass
+    
     for path in search_paths:
-        if path.exists():
+        if os.path.isfile(path):
             try:
-                return ctypes.CDLL(str(path))
-            except OSError as e:
+                lib = ctypes.CDLL(path)
+            except OSError:
                 # Try next path if loading fails
                 continue
+            if path != cached:
+                _write_libcache(path)
+            return lib
     
     # If not found, raise error with helpful message
     raise LibraryNotFoundError(
         "Could not find libplumbr.so. "
-        "Please ensure PlumbrC is installed correctly. "
-        f"Searched: {[str(p) for p in search_paths]}"
+        "Please ensure PlumbrC is installed correctly "
+        "or set PLUMBRC_LIB to its path. "
+        f"Searched: {search_paths}"
     )
 
 
 # Load library once at module import
 _lib = _find_library()
 
-# Set up function signatures
-_lib.libplumbr_new.argtypes = [POINTER(PlumbrConfig)]
-_lib.libplumbr_new.restype = c_void_p
+# Function signatures, applied lazily on first use of each symbol
+_SIGS = {
+    "libplumbr_new": ([POINTER(PlumbrConfig)], c_void_p),
+    "libplumbr_new_ex": ([POINTER(PlumbrConfig), ctypes.c_uint], c_void_p),
+    "libplumbr_free": ([c_void_p], None),
+    "libplumbr_version": ([], c_char_p),
+    "libplumbr_pattern_count": ([c_void_p], c_size_t),
+    "libplumbr_get_stats": ([c_void_p], PlumbrStats),
+    "libplumbr_redact_into": ([c_void_p, c_char_p, c_size_t, POINTER(c_char), c_size_t, POINTER(c_size_t)], c_int),
+    "libplumbr_redact_line_into": ([c_void_p, c_char_p, c_size_t, POINTER(c_char), c_size_t, POINTER(c_size_t)], c_int),
+}
+
+
+class _Syms:
+    """
+    Lazily configured view of libplumbr's functions.
+    
+    A symbol is looked up in the CDLL and given its argtypes/restype the
+    first time it is accessed, then cached as a plain instance attribute,
+    so later accesses never reach __getattr__. Importing plumbrc only pays
+    for the symbols a program actually calls.
+    """
+    
+    def __getattr__(self, name: str):
+        try:
+            sig = _SIGS[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        fn = getattr(_lib, name)
+        fn.argtypes, fn.restype = sig
+        setattr(self, name, fn)
+        return fn
+
+
+_syms = _Syms()
+
+
+class _CtypesCalls(OutputBuffer):
+    """Per-handle redaction calls through ctypes."""
+
+    __slots__ = ()
+
+    def __init__(self, handle: int):
+        super().__init__()
+        self._handle = handle
+        # Bound per handle so the hot path is a single slot read
+        self._redact_into = _syms.libplumbr_redact_into
+        self._redact_line_into = _syms.libplumbr_redact_line_into
+        # Reusable output-length cell; a handle is single-threaded anyway
+        self._out_len = (c_size_t * 1)()
+
+    def _wrap_output(self, buf: bytearray):
+        return (c_char * len(buf)).from_buffer(buf)
+
+    def _wrap_input(self, data, n: int):
+        try:
+            # Zero-copy for writable buffers (bytearray, mmap, ...)
+            return (c_char * n).from_buffer(data)
+        except TypeError:
+            # Read-only buffers cannot be wrapped by ctypes
+            return bytes(data)
+
+
+class _ClosedCalls:
+    """Stand-in for the calls of a closed instance; every call fails."""
+
+    __slots__ = ()
+
+    def redact_buffer_view(self, data) -> None:
+        return None
+
+    redact_buffer = redact_line = redact_buffer_view
+
+
+_CLOSED_CALLS = _ClosedCalls()
 
-_lib.libplumbr_redact.argtypes = [c_void_p, c_char_p, c_size_t, POINTER(c_size_t)]
-_lib.libplumbr_redact.restype = c_void_p
 
-_lib.libplumbr_free.argtypes = [c_void_p]
-_lib.libplumbr_free.restype = None
+# Prefer the cffi binding for the per-call hot path when it is installed
+_Calls = _CtypesCalls
+BACKEND = "ctypes"
+if not os.environ.get("PLUMBRC_NO_CFFI"):
+    try:
+        from plumbrc import _plumbr_cffi
+    except ImportError:
+        pass
+    else:
+        _plumbr_cffi.load(_lib._name)
+        _Calls = _plumbr_cffi.CffiCalls
+        BACKEND = "cffi"
 
-_lib.libplumbr_free_string.argtypes = [c_void_p]
-_lib.libplumbr_free_string.restype = None
 
-_lib.libplumbr_version.argtypes = []
-_lib.libplumbr_version.restype = c_char_p
+# Longer inputs are rarely repeated verbatim and are not cached
+_CACHE_MAX_LEN = 1024
 
-_lib.libplumbr_pattern_count.argtypes = [c_void_p]
-_lib.libplumbr_pattern_count.restype = c_size_t
+# Separators that nearly every key=value / URL / quoted secret pattern
+# needs; fast_skip only sends input containing one of them to C
+_FAST_SKIP_SIGILS = b'=:/"\''
 
-_lib.libplumbr_get_stats.argtypes = [c_void_p]
-_lib.libplumbr_get_stats.restype = PlumbrStats
 
-_lib.libplumbr_redact_buffer.argtypes = [c_void_p, c_char_p, c_size_t, POINTER(c_size_t)]
-_lib.libplumbr_redact_buffer.restype = c_void_p
+def _enc(s: Optional[str]) -> Optional[bytes]:
+    """Encode an optional config string for the C struct."""
+    return s.encode() if s else None
 
 
 class Plumbr:
@@ -118,6 +259,11 @@ class Plumbr:
     This class provides a Python interface to the PlumbrC C library for
     detecting and redacting secrets from text data.
     
+    The GIL is released for the duration of each C call (both the ctypes
+    and cffi bindings), so threads using separate instances redact in
+    parallel. A single instance must not be shared between threads; see
+    PlumbrPool.
+    
     Example:
         >>> p = Plumbr()
         >>> p.redact("api_key=sk-proj-abc123")
@@ -136,7 +282,10 @@ class Plumbr:
         pattern_dir: Optional[str] = None,
         compliance: Optional[list] = None,
         num_threads: int = 0,
-        quiet: bool = True
+        quiet: bool = True,
+        flat_dfa: bool = False,
+        cache_size: int = 4096,
+        fast_skip: bool = False
     ):
         """
         Initialize PlumbrC redactor.
@@ -148,65 +297,166 @@ class Plumbr:
                         Available: hipaa, pci, gdpr, soc2, all
             num_threads: Number of worker threads (0 = auto-detect)
             quiet: Suppress statistics output
+            flat_dfa: Build the full pattern automaton as a flat
+                      transition table instead of the compressed default.
+                      Costs memory (up to 512 bytes per state) and
+                      construction time; output is identical
+            cache_size: Number of recent redact() results to keep, keyed
+                        by input; 0 disables the cache
+            fast_skip: Return bytes input unchanged, without calling C,
+                       when it contains none of = : / " '. Unsafe for
+                       sigil-free secrets such as bare AWS keys, card
+                       numbers or SSNs; only enable it when the pattern
+                       set never matches those
             
         Raises:
             RuntimeError: If initialization fails
         """
-        config = None
-        comp_str = None
-        if compliance:
-            comp_str = ','.join(compliance) if isinstance(compliance, list) else compliance
-        
-        if pattern_file or pattern_dir or comp_str or num_threads or not quiet:
-            config = PlumbrConfig()
-            config.pattern_file = pattern_file.encode() if pattern_file else None
-            config.pattern_dir = pattern_dir.encode() if pattern_dir else None
-            config.compliance = comp_str.encode() if comp_str else None
-            config.num_threads = num_threads
-            config.quiet = 1 if quiet else 0
-        
-        self._handle = _lib.libplumbr_new(ctypes.byref(config) if config else None)
+        if isinstance(compliance, list):
+            compliance = ','.join(compliance)
+        
+        # Encoded once; the C side treats NULL fields as defaults, so an
+        # all-default config is equivalent to passing NULL
+        self._pattern_file = _enc(pattern_file)
+        self._pattern_dir = _enc(pattern_dir)
+        self._compliance = _enc(compliance)
+        
+        config = PlumbrConfig()
+        config.pattern_file = self._pattern_file
+        config.pattern_dir = self._pattern_dir
+        config.compliance = self._compliance
+        config.num_threads = num_threads
+        config.quiet = 1 if quiet else 0
+        
+        if flat_dfa:
+            self._handle = _syms.libplumbr_new_ex(ctypes.byref(config), _FLAT_DFA)
+        else:
+            self._handle = _syms.libplumbr_new(ctypes.byref(config))
         if not self._handle:
             raise RuntimeError("Failed to create Plumbr instance")
+        
+        self._calls = _Calls(self._handle)
+        self._fast_skip = fast_skip
+        self._cache_size = cache_size
+        self._cache: Optional["OrderedDict[str, str]"] = (
+            OrderedDict() if cache_size > 0 else None
+        )
     
-    def redact(self, text: str) -> str:
+    def redact(self, text: str, return_bytes: bool = False) -> Union[str, bytes]:
         """
         Redact secrets from text.
         
+        The text is matched as a single unit, newlines included, so a
+        secret whose key and value sit on different lines is still
+        redacted. Use redact_bulk() or redact_lines() to process
+        newline-separated log lines independently.
+        
+        All matchers (the literal DFA and the JIT-compiled PCRE2 patterns)
+        are built in __init__, so the first call pays no compile cost.
+        
+        Results for inputs up to 1024 characters are kept in a per-instance
+        LRU cache (see cache_size), so repeated lines such as health checks
+        skip the C call. Cache hits are not counted in stats.
+        
         Args:
             text: Input text to redact
+            return_bytes: Return the raw UTF-8 result as bytes instead of
+                          decoding it to str
             
         Returns:
             Redacted text with secrets replaced by [REDACTED:type] tags
             
         Raises:
-            RedactionError: If redaction fails
+            RedactionError: If redaction fails or the encoded text is
+                            longer than 64KB
         """
         if not text:
-            return text
-            
-        input_bytes = text.encode('utf-8')
-        out_len = c_size_t()
-        
-        result_ptr = _lib.libplumbr_redact(
-            self._handle,
-            input_bytes,
-            len(input_bytes),
-            ctypes.byref(out_len)
-        )
+            return b"" if return_bytes else text
         
-        if not result_ptr:
+        cache = self._cache
+        if cache is None or return_bytes or len(text) > _CACHE_MAX_LEN:
+            result = self._redact_line(text.encode('utf-8'))
+            return result if return_bytes else result.decode('utf-8')
+        
+        result = cache.get(text)
+        if result is not None:
+            cache.move_to_end(text)
+            return result
+        
+        result = self._redact_line(text.encode('utf-8')).decode('utf-8')
+        cache[text] = result
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return result
+    
+    def _redact_line(self, data: bytes) -> bytes:
+        """Redact encoded text as one unit; the uncached core of redact()."""
+        if (self._fast_skip
+                and len(data.translate(None, _FAST_SKIP_SIGILS)) == len(data)):
+            return data
+        
+        result = self._calls.redact_line(data)
+        if result is None:
             raise RedactionError("Redaction operation failed")
         
-        try:
-            # Copy result and decode
-            result = ctypes.string_at(result_ptr, out_len.value).decode('utf-8')
-        finally:
-            # Free the C string
-            _lib.libplumbr_free_string(result_ptr)
+        return result
+    
+    def redact_bytes(self, data) -> bytes:
+        """
+        Redact an already-encoded UTF-8 buffer without decoding.
+        
+        Useful for logging pipelines that handle bytes end to end; skips
+        both the encode of the input and the decode of the result.
+        Any buffer-protocol object is accepted; bytes and writable buffers
+        such as bytearray are passed to C without copying.
+        
+        Args:
+            data: UTF-8 encoded input (bytes, bytearray or memoryview;
+                  may contain multiple lines)
+            
+        Returns:
+            Redacted bytes
+            
+        Raises:
+            RedactionError: If redaction fails
+        """
+        if not data:
+            return b""
+        
+        if (self._fast_skip and type(data) is bytes
+                and len(data.translate(None, _FAST_SKIP_SIGILS)) == len(data)):
+            return data
+        
+        result = self._calls.redact_buffer(data)
+        if result is None:
+            raise RedactionError("Bytes redaction failed")
         
         return result
     
+    def redact_view(self, data) -> memoryview:
+        """
+        Redact a UTF-8 buffer and return a zero-copy view of the result.
+        
+        The view points into an output buffer owned by this instance and
+        is only valid until the next redact_view/redact_bytes/redact_bulk
+        call; copy it (bytes(view)) if it must outlive that.
+        
+        Args:
+            data: UTF-8 encoded input (bytes, bytearray or memoryview;
+                  may contain multiple lines)
+            
+        Returns:
+            memoryview over the redacted bytes
+            
+        Raises:
+            RedactionError: If redaction fails
+        """
+        view = self._calls.redact_buffer_view(data)
+        if view is None:
+            raise RedactionError("Bytes redaction failed")
+        
+        return view
+    
     def redact_lines(self, lines: List[str]) -> List[str]:
         """
         Redact multiple lines of text (uses bulk buffer API).
@@ -224,7 +474,52 @@ class Plumbr:
             return []
         return self.redact_bulk('\n'.join(lines)).split('\n')
     
-    def redact_bulk(self, text: str) -> str:
+    def redact_many(self, texts: Sequence[str]) -> List[str]:
+        """
+        Redact a sequence of independent strings in one FFI call.
+        
+        Unlike redact_lines(), the result always has one entry per input,
+        even when an input contains newlines. Inputs are joined into a
+        single buffer so the Python/C boundary is crossed once; if any
+        input contains a newline, each one is redacted separately instead.
+        
+        Args:
+            texts: Sequence of strings to redact
+            
+        Returns:
+            List of redacted strings, in input order
+            
+        Raises:
+            RedactionError: If redaction fails
+        """
+        if not texts:
+            return []
+        joined = '\n'.join(texts)
+        if joined.count('\n') != len(texts) - 1:
+            return [self.redact(t) for t in texts]
+        return self.redact_bulk(joined).split('\n')
+    
+    def redact_lines_bytes(self, lines: Sequence[bytes]) -> List[bytes]:
+        """
+        Redact multiple UTF-8 encoded lines (uses bulk buffer API).
+        
+        Bytes counterpart of redact_lines(): the join, the C call and the
+        split all stay at C speed, with no encode/decode in between.
+        
+        Args:
+            lines: Sequence of encoded lines (without trailing newlines)
+            
+        Returns:
+            List of redacted lines as bytes
+            
+        Raises:
+            RedactionError: If redaction fails
+        """
+        if not lines:
+            return []
+        return self.redact_view(b'\n'.join(lines)).tobytes().split(b'\n')
+    
+    def redact_bulk(self, text: str, return_bytes: bool = False) -> Union[str, bytes]:
         """
         Redact a multi-line string in a single FFI call.
         
@@ -233,6 +528,8 @@ class Plumbr:
         
         Args:
             text: Newline-separated input text
+            return_bytes: Return the raw UTF-8 result as bytes instead of
+                          decoding it to str
             
         Returns:
             Newline-separated redacted text
@@ -241,54 +538,49 @@ class Plumbr:
             RedactionError: If redaction fails
         """
         if not text:
-            return text
+            return b"" if return_bytes else text
         
-        input_bytes = text.encode('utf-8')
-        out_len = c_size_t()
-        
-        result_ptr = _lib.libplumbr_redact_buffer(
-            self._handle,
-            input_bytes,
-            len(input_bytes),
-            ctypes.byref(out_len)
-        )
-        
-        if not result_ptr:
-            raise RedactionError("Bulk redaction failed")
-        
-        try:
-            result = ctypes.string_at(result_ptr, out_len.value).decode('utf-8')
-        finally:
-            _lib.libplumbr_free_string(result_ptr)
-        
-        return result
+        result = self.redact_bytes(text.encode('utf-8'))
+        return result if return_bytes else result.decode('utf-8')
     
     @property
     def pattern_count(self) -> int:
         """Get number of loaded patterns."""
-        return _lib.libplumbr_pattern_count(self._handle)
+        return _syms.libplumbr_pattern_count(self._handle)
     
     @property
-    def stats(self) -> Dict[str, int]:
+    def stats(self) -> PlumbrStats:
         """
         Get processing statistics.
         
+        Returns the C struct by value, so reading one field costs no
+        Python-side conversion. The result is a snapshot; it does not
+        update as the instance keeps redacting.
+        
+        Only input that reaches the C engine is counted; redact() cache
+        hits are not. Use cache_size=0 for exact per-call counts.
+        
+        Returns:
+            PlumbrStats with fields: lines_processed, lines_modified,
+            patterns_matched, bytes_processed, elapsed_seconds
+        """
+        return _syms.libplumbr_get_stats(self._handle)
+    
+    @property
+    def stats_dict(self) -> Dict[str, Union[int, float]]:
+        """
+        Get processing statistics as a dictionary.
+        
         Returns:
-            Dictionary with keys: lines_processed, lines_modified, patterns_matched
+            Dictionary with keys: lines_processed, lines_modified,
+            patterns_matched, bytes_processed, elapsed_seconds
         """
-        s = _lib.libplumbr_get_stats(self._handle)
-        return {
-            "lines_processed": s.lines_processed,
-            "lines_modified": s.lines_modified,
-            "patterns_matched": s.patterns_matched,
-            "bytes_processed": s.bytes_processed,
-            "elapsed_seconds": s.elapsed_seconds,
-        }
+        return self.stats._asdict()
     
     @staticmethod
     def version() -> str:
         """Get PlumbrC library version."""
-        return _lib.libplumbr_version().decode()
+        return _syms.libplumbr_version().decode()
     
     def __enter__(self):
         """Context manager entry."""
@@ -302,7 +594,11 @@ class Plumbr:
     def close(self):
         """Explicitly free resources."""
         if hasattr(self, '_handle') and self._handle:
-            _lib.libplumbr_free(self._handle)
+            # Later calls must fail in Python rather than reach the freed handle
+            self._calls = _CLOSED_CALLS
+            if getattr(self, '_cache', None):
+                self._cache.clear()
+            _syms.libplumbr_free(self._handle)
             self._handle = None
     
     def __del__(self):
@@ -311,4 +607,9 @@ class Plumbr:
     
     def __repr__(self):
         """String representation."""
-        return f"Plumbr(patterns={self.pattern_count})"
+        parts = [f"patterns={self.pattern_count}"]
+        for name in ("pattern_file", "pattern_dir", "compliance"):
+            value = getattr(self, "_" + name)
+            if value:
+                parts.append(f"{name}={value.decode()!r}")
+        return f"Plumbr({', '.join(parts)})"
@@ -0,0 +1,55 @@
+"""
+Optional cffi (ABI mode) binding for the redaction hot path.
+
+ctypes routes every call through a generic libffi trampoline and argument
+conversion; cffi's ABI mode dispatches through precompiled per-signature
+stubs, which cuts the fixed per-call cost noticeably for short lines.
+No compile step is needed: the same libplumbr.so is opened with
+ffi.dlopen().
+
+This module is imported by plumbrc._plumbr when cffi is installed. Only
+the per-call redaction entry points live here; instance setup, teardown
+and statistics stay on ctypes.
+"""
+
+import cffi
+
+from plumbrc._buffers import OutputBuffer
+
+ffi = cffi.FFI()
+ffi.cdef("""
+    int libplumbr_redact_into(void *p, const char *input, size_t input_len,
+                              char *output, size_t output_cap,
+                              size_t *output_len);
+    int libplumbr_redact_line_into(void *p, const char *input,
+                                   size_t input_len, char *output,
+                                   size_t output_cap, size_t *output_len);
+""")
+
+_lib = None
+
+
+def load(path: str) -> None:
+    """Open the already-located libplumbr.so through cffi."""
+    global _lib
+    _lib = ffi.dlopen(path)
+
+
+class CffiCalls(OutputBuffer):
+    """Per-handle redaction calls through cffi."""
+
+    __slots__ = ()
+
+    def __init__(self, handle: int):
+        super().__init__()
+        self._handle = ffi.cast("void *", handle)
+        self._out_len = ffi.new("size_t *")
+        self._redact_into = _lib.libplumbr_redact_into
+        self._redact_line_into = _lib.libplumbr_redact_line_into
+
+    def _wrap_output(self, buf: bytearray):
+        return ffi.from_buffer(buf)
+
+    def _wrap_input(self, data, n: int):
+        # Zero-copy for any contiguous buffer, read-only or not
+        return ffi.from_buffer(data)
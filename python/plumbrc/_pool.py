@@ -0,0 +1,177 @@
+"""
+Reuse of Plumbr instances across callers.
+
+Creating a Plumbr loads and compiles the whole pattern set in C, which is
+far more expensive than a redact() call. A single instance must not be
+used from several threads at once (the C handle owns one scratch buffer),
+but separate instances are independent. This module offers two ways to
+share the construction cost:
+
+- get_pooled(): one cached instance per configuration *per thread*
+- PlumbrPool: a fixed set of instances handed out to threads on demand
+
+The C call releases the GIL, so PlumbrPool.redact_lines() can also shard
+one large list across all of its instances and run them on separate cores.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from plumbrc._plumbr import Plumbr
+
+
+_local = threading.local()
+
+
+def _config_key(
+    pattern_file: Optional[str] = None,
+    pattern_dir: Optional[str] = None,
+    compliance=None,
+    num_threads: int = 0,
+    quiet: bool = True,
+    flat_dfa: bool = False,
+    cache_size: int = 4096,
+    fast_skip: bool = False,
+) -> Tuple:
+    if isinstance(compliance, list):
+        compliance = tuple(compliance)
+    return (pattern_file, pattern_dir, compliance, num_threads, quiet, flat_dfa,
+            cache_size, fast_skip)
+
+
+def get_pooled(**kwargs) -> Plumbr:
+    """
+    Get a cached Plumbr for the given configuration.
+
+    Accepts the same keyword arguments as Plumbr(). Instances are cached
+    per thread, so the returned object is safe to use without locking
+    from the calling thread. Do not close() it; it lives as long as the
+    thread.
+
+    Example:
+        >>> p = get_pooled(compliance=["hipaa"])
+        >>> p is get_pooled(compliance=["hipaa"])
+        True
+    """
+    instances: Optional[Dict[Tuple, Plumbr]] = getattr(_local, "instances", None)
+    if instances is None:
+        instances = _local.instances = {}
+
+    key = _config_key(**kwargs)
+    p = instances.get(key)
+    if p is None or p._handle is None:
+        # Replace an instance the caller closed despite the docstring
+        p = instances[key] = Plumbr(**kwargs)
+    return p
+
+
+class PlumbrPool:
+    """
+    Fixed-size pool of Plumbr instances for thread-level parallelism.
+
+    Each acquire() hands out an instance exclusively until the block exits,
+    so N threads can redact concurrently with N instances.
+
+    Example:
+        >>> pool = PlumbrPool(size=4)
+        >>> with pool.acquire() as p:
+        ...     safe = p.redact("password=secret123")
+    """
+
+    def __init__(self, size: int = 4, **kwargs):
+        """
+        Create the pool.
+
+        Args:
+            size: Number of instances to construct up front
+            **kwargs: Passed to each Plumbr()
+
+        Raises:
+            ValueError: If size is less than 1
+        """
+        if size < 1:
+            raise ValueError("PlumbrPool size must be at least 1")
+        self._instances = [Plumbr(**kwargs) for _ in range(size)]
+        self._free: "queue.SimpleQueue[Plumbr]" = queue.SimpleQueue()
+        for p in self._instances:
+            self._free.put(p)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of instances in the pool."""
+        return len(self._instances)
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[Plumbr]:
+        """
+        Borrow an instance, blocking until one is free.
+
+        Raises:
+            queue.Empty: If timeout expires before an instance is free
+        """
+        p = self._free.get(timeout=timeout)
+        try:
+            yield p
+        finally:
+            self._free.put(p)
+
+    def _redact_chunk(self, lines: List[str]) -> List[str]:
+        with self.acquire() as p:
+            return p.redact_lines(lines)
+
+    def redact_lines(self, lines: List[str]) -> List[str]:
+        """
+        Redact a list of lines using every instance in the pool at once.
+
+        The list is split into one contiguous chunk per instance and the
+        chunks are redacted in parallel worker threads, each holding its
+        own instance. Lists too small to split go straight to one instance.
+
+        Args:
+            lines: List of text lines to redact
+
+        Returns:
+            List of redacted lines, in input order
+        """
+        n = self.size
+        if n == 1 or len(lines) < 2 * n:
+            return self._redact_chunk(lines)
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=n, thread_name_prefix="plumbr")
+        step = -(-len(lines) // n)
+        chunks = [lines[i:i + step] for i in range(0, len(lines), step)]
+
+        result: List[str] = []
+        for part in self._executor.map(self._redact_chunk, chunks):
+            result.extend(part)
+        return result
+
+    def close(self):
+        """Free all instances in the pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for p in self._instances:
+            p.close()
+        self._instances = []
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+        return False
+
+    def __repr__(self):
+        """String representation."""
+        return f"PlumbrPool(size={self.size})"
@@ -16,17 +16,38 @@ Usage:
 
     # Streaming (maximum throughput)
     results = client.redact_stream(["line1", "line2", ...])
+
+    # Streaming, consuming results as they arrive
+    for safe in client.redact_stream_iter(open("app.log")):
+        print(safe)
+
+    # asyncio
+    from plumbrc.grpc_client import AsyncPlumbrGRPC
+
+    async with AsyncPlumbrGRPC("localhost:50051") as client:
+        results = await asyncio.gather(*[client.redact(l) for l in lines])
 """
 
 from __future__ import annotations
 
-from typing import Iterator
+from collections import deque
+from operator import attrgetter
+from typing import AsyncIterator, Iterable, Iterator
 
 import grpc
 
 # Generated protobuf stubs
 from plumbrc.proto import plumbr_pb2, plumbr_pb2_grpc
 
+_CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", 2 * 1024 * 1024),
+    ("grpc.max_receive_message_length", 2 * 1024 * 1024),
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+]
+
+_redacted = attrgetter("redacted")
+
 
 class PlumbrGRPC:
     """gRPC client for PlumbrC redaction service."""
@@ -44,15 +65,7 @@ class PlumbrGRPC:
         if secure:
             self.channel = grpc.secure_channel(host, grpc.ssl_channel_credentials())
         else:
-            self.channel = grpc.insecure_channel(
-                host,
-                options=[
-                    ("grpc.max_send_message_length", 2 * 1024 * 1024),
-                    ("grpc.max_receive_message_length", 2 * 1024 * 1024),
-                    ("grpc.keepalive_time_ms", 30000),
-                    ("grpc.keepalive_timeout_ms", 10000),
-                ],
-            )
+            self.channel = grpc.insecure_channel(host, options=_CHANNEL_OPTIONS)
 
         self.stub = plumbr_pb2_grpc.PlumbrServiceStub(self.channel)
 
@@ -66,23 +79,54 @@ class PlumbrGRPC:
         """Redact multiple lines in one call."""
         req = plumbr_pb2.RedactBatchRequest(texts=texts)
         resp = self.stub.RedactBatch(req, timeout=self.timeout)
-        return [r.redacted for r in resp.results]
+        return list(map(_redacted, resp.results))
 
-    def redact_stream(self, texts: list[str]) -> list[str]:
+    def redact_stream(self, texts: Iterable[str]) -> list[str]:
         """
         Bidirectional streaming redaction — maximum throughput.
 
         Streams lines to the server and collects redacted lines back.
         """
+        return list(self.redact_stream_iter(texts))
+
+    def redact_stream_iter(self, texts: Iterable[str]) -> Iterator[str]:
+        """
+        Bidirectional streaming redaction, yielding results as they arrive.
+
+        Requests are pulled lazily from texts, so the caller's work on each
+        result overlaps with the server processing the following lines.
+        """
+
+        def request_iterator() -> Iterator[plumbr_pb2.RedactRequest]:
+            for text in texts:
+                yield plumbr_pb2.RedactRequest(text=text)
+
+        responses = self.stub.RedactStream(
+            request_iterator(), timeout=self.timeout
+        )
+        yield from map(_redacted, responses)
+
+    def redact_stream_pairs(
+        self, texts: Iterable[str]
+    ) -> Iterator[tuple[str, str]]:
+        """
+        Like redact_stream_iter, but yields (input, redacted) pairs.
+
+        The server answers in request order, so only inputs still in flight
+        are held in memory.
+        """
+        in_flight: deque[str] = deque()
 
         def request_iterator() -> Iterator[plumbr_pb2.RedactRequest]:
             for text in texts:
+                in_flight.append(text)
                 yield plumbr_pb2.RedactRequest(text=text)
 
         responses = self.stub.RedactStream(
             request_iterator(), timeout=self.timeout
         )
-        return [resp.redacted for resp in responses]
+        for resp in responses:
+            yield in_flight.popleft(), resp.redacted
 
     def health(self) -> dict:
         """Check server health."""
@@ -104,3 +148,85 @@ class PlumbrGRPC:
 
     def __exit__(self, *args):
         self.close()
+
+
+class AsyncPlumbrGRPC:
+    """
+    asyncio gRPC client for PlumbrC redaction service.
+
+    Uses grpc.aio, so thousands of concurrent redactions share one event
+    loop instead of one OS thread per in-flight call.
+
+    Example:
+        async with AsyncPlumbrGRPC("localhost:50051") as client:
+            results = await asyncio.gather(*[client.redact(l) for l in lines])
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost:50051",
+        *,
+        secure: bool = False,
+        timeout: float = 30.0,
+    ):
+        self.host = host
+        self.timeout = timeout
+
+        if secure:
+            self.channel = grpc.aio.secure_channel(
+                host, grpc.ssl_channel_credentials()
+            )
+        else:
+            self.channel = grpc.aio.insecure_channel(host, options=_CHANNEL_OPTIONS)
+
+        self.stub = plumbr_pb2_grpc.PlumbrServiceStub(self.channel)
+
+    async def redact(self, text: str) -> str:
+        """Redact a single line."""
+        req = plumbr_pb2.RedactRequest(text=text)
+        resp = await self.stub.Redact(req, timeout=self.timeout)
+        return resp.redacted
+
+    async def redact_batch(self, texts: list[str]) -> list[str]:
+        """Redact multiple lines in one call."""
+        req = plumbr_pb2.RedactBatchRequest(texts=texts)
+        resp = await self.stub.RedactBatch(req, timeout=self.timeout)
+        return list(map(_redacted, resp.results))
+
+    async def redact_stream(self, texts: Iterable[str]) -> AsyncIterator[str]:
+        """
+        Bidirectional streaming redaction, yielding results as they arrive.
+
+        Usage:
+            async for safe in client.redact_stream(lines):
+                ...
+        """
+
+        def request_iterator() -> Iterator[plumbr_pb2.RedactRequest]:
+            for text in texts:
+                yield plumbr_pb2.RedactRequest(text=text)
+
+        call = self.stub.RedactStream(request_iterator(), timeout=self.timeout)
+        async for resp in call:
+            yield resp.redacted
+
+    async def health(self) -> dict:
+        """Check server health."""
+        req = plumbr_pb2.HealthRequest()
+        resp = await self.stub.Health(req, timeout=5.0)
+        return {
+            "status": resp.status,
+            "version": resp.version,
+            "patterns_loaded": resp.patterns_loaded,
+            "uptime_seconds": resp.uptime_seconds,
+        }
+
+    async def close(self):
+        """Close the gRPC channel."""
+        await self.channel.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -3,12 +3,15 @@
 Setup script for plumbrc Python package.
 
 Builds libplumbr.so from C source and bundles it in the wheel.
+Set PLUMBRC_PGO=1 for a profile-guided build (make pgo-shared): the
+library is built instrumented, trained through this package, then
+rebuilt with the profile and LTO.
 """
 
 import os
 import subprocess
 from pathlib import Path
-from setuptools import setup
+from setuptools import Distribution, setup
 from setuptools.command.build_py import build_py
 
 
@@ -25,7 +28,8 @@ class BuildWithC(build_py):
         makefile = c_root / "Makefile"
         if makefile.exists():
             lib_dest.mkdir(parents=True, exist_ok=True)
-            subprocess.check_call(["make", "shared"], cwd=str(c_root))
+            target = "pgo-shared" if os.environ.get("PLUMBRC_PGO") == "1" else "shared"
+            subprocess.check_call(["make", target], cwd=str(c_root))
             so_file = c_root / "build" / "lib" / "libplumbr.so"
             if so_file.exists():
                 import shutil
@@ -33,6 +37,18 @@ class BuildWithC(build_py):
 
         super().run()
 
+        # Ship an empty library-path cache so it is listed in the wheel's
+        # RECORD and pip uninstall removes the copy written at import time
+        cache = Path(self.build_lib) / "plumbrc" / ".libcache"
+        cache.write_text("")
+
+
+class BinaryDistribution(Distribution):
+    """The wheel bundles a native library, so it must be platform-tagged."""
+
+    def has_ext_modules(self):
+        return True
+
 
 readme_file = Path(__file__).parent / "README.md"
 long_description = ""
@@ -45,4 +61,5 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     cmdclass={"build_py": BuildWithC},
+    distclass=BinaryDistribution,
 )
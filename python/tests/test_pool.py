@@ -0,0 +1,90 @@
+"""Instance reuse tests for plumbrc."""
+
+import threading
+
+import pytest
+from plumbrc import Plumbr, PlumbrPool, get_pooled
+
+
+def test_get_pooled_returns_cached_instance():
+    """Test that the same configuration reuses one instance."""
+    p = get_pooled()
+    assert isinstance(p, Plumbr)
+    assert get_pooled() is p
+    assert "[REDACTED:" in p.redact("password=secret123")
+
+
+def test_get_pooled_keys_on_config():
+    """Test that different configurations get different instances."""
+    assert get_pooled(compliance=["pci"]) is get_pooled(compliance=["pci"])
+    assert get_pooled(compliance=["pci"]) is not get_pooled()
+    assert get_pooled(flat_dfa=True) is not get_pooled()
+
+
+def test_get_pooled_replaces_closed_instance():
+    """Test that a closed cached instance is not handed out again."""
+    with get_pooled(compliance=["gdpr"]) as p:
+        p.redact("password=secret123")
+    
+    fresh = get_pooled(compliance=["gdpr"])
+    assert fresh is not p
+    assert "[REDACTED:" in fresh.redact("password=secret123")
+    assert get_pooled(compliance=["gdpr"]) is fresh
+
+
+def test_get_pooled_per_thread():
+    """Test that each thread gets its own instance."""
+    main = get_pooled()
+    seen = []
+    
+    t = threading.Thread(target=lambda: seen.append(get_pooled()))
+    t.start()
+    t.join()
+    
+    assert seen[0] is not main
+
+
+def test_pool_acquire():
+    """Test borrowing instances from a pool."""
+    with PlumbrPool(size=2) as pool:
+        assert pool.size == 2
+        with pool.acquire() as a, pool.acquire() as b:
+            assert a is not b
+            assert "[REDACTED:" in a.redact("password=secret123")
+
+
+def test_pool_concurrent_use():
+    """Test that threads sharing a pool redact correctly."""
+    results = []
+    
+    with PlumbrPool(size=2) as pool:
+        def worker():
+            for _ in range(100):
+                with pool.acquire() as p:
+                    results.append(p.redact("password=secret123"))
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    
+    assert len(results) == 400
+    assert all("[REDACTED:" in r for r in results)
+
+
+def test_pool_invalid_size():
+    """Test that an empty pool is rejected."""
+    with pytest.raises(ValueError):
+        PlumbrPool(size=0)
+
+
+def test_pool_redact_lines():
+    """Test that sharded redaction matches a single instance, in order."""
+    lines = ["password=secret123", "normal log line", "api_key=sk-proj-test123"] * 50
+    expected = Plumbr().redact_lines(lines)
+    
+    with PlumbrPool(size=3) as pool:
+        assert pool.redact_lines(lines) == expected
+        assert pool.redact_lines(lines[:2]) == expected[:2]
+        assert pool.redact_lines([]) == []
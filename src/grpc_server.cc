@@ -7,6 +7,7 @@
  *
  * Build: make grpc
  * Usage: plumbr-grpc [--port 50051] [--threads 4] [--pattern-dir DIR]
+ *                    [--unix /tmp/plumbrc.sock]
  */
 
 #include <atomic>
@@ -17,6 +18,9 @@
 #include <string>
 #include <thread>
 
+#include <sys/stat.h>
+#include <unistd.h>
+
 #include <grpcpp/grpcpp.h>
 #include <grpcpp/health_check_service_interface.h>
 
@@ -231,6 +235,7 @@ static void print_usage(const char *prog) {
             << "  --threads N          gRPC threads (default: 4)\n"
             << "  --pattern-dir DIR    Load patterns from directory\n"
             << "  --pattern-file FILE  Load patterns from file\n"
+            << "  --unix PATH          Also listen on a Unix domain socket\n"
             << "  --help               Show this help\n";
 }
 
@@ -239,6 +244,7 @@ int main(int argc, char *argv[]) {
   int num_threads = 4;
   const char *pattern_dir = nullptr;
   const char *pattern_file = nullptr;
+  const char *unix_path = nullptr;
 
   for (int i = 1; i < argc; i++) {
     std::string arg = argv[i];
@@ -250,6 +256,8 @@ int main(int argc, char *argv[]) {
       pattern_dir = argv[++i];
     } else if (arg == "--pattern-file" && i + 1 < argc) {
       pattern_file = argv[++i];
+    } else if (arg == "--unix" && i + 1 < argc) {
+      unix_path = argv[++i];
     } else if (arg == "--help") {
       print_usage(argv[0]);
       return 0;
@@ -289,6 +297,24 @@ int main(int argc, char *argv[]) {
    *   builder.AddListeningPort(addr, creds);
    */
   builder.AddListeningPort(addr, grpc::InsecureServerCredentials());
+
+  /* Local clients skip the TCP loopback stack over a Unix socket */
+  std::string unix_addr;
+  if (unix_path) {
+    /* Only clear a stale socket left by a previous run; never remove
+     * anything else that happens to live at the given path */
+    struct stat st;
+    if (lstat(unix_path, &st) == 0) {
+      if (!S_ISSOCK(st.st_mode)) {
+        std::cerr << "FATAL: --unix path " << unix_path
+                  << " exists and is not a socket\n";
+        return 1;
+      }
+      unlink(unix_path);
+    }
+    unix_addr = std::string("unix:") + unix_path;
+    builder.AddListeningPort(unix_addr, grpc::InsecureServerCredentials());
+  }
   builder.RegisterService(&service);
 
   /* Set thread pool size */
@@ -319,8 +345,10 @@ int main(int argc, char *argv[]) {
             << "║  Patterns: " << pattern_count
             << "                             ║\n"
             << "╚══════════════════════════════════════════╝\n\n"
-            << "Listening on " << addr << "\n"
-            << "Press Ctrl+C to stop\n\n";
+            << "Listening on " << addr << "\n";
+  if (unix_path)
+    std::cerr << "Listening on " << unix_addr << "\n";
+  std::cerr << "Press Ctrl+C to stop\n\n";
 
   server->Wait();
 
@@ -27,6 +27,14 @@ struct libplumbr {
 };
 
 libplumbr_t *libplumbr_new(const libplumbr_config_t *config) {
+  return libplumbr_new_ex(config, 0);
+}
+
+libplumbr_t *libplumbr_new_ex(const libplumbr_config_t *config,
+                              unsigned int flags) {
+  if (flags & ~LIBPLUMBR_FLAT_DFA)
+    return NULL; /* Unknown flag from a newer caller */
+
   libplumbr_t *p = calloc(1, sizeof(libplumbr_t));
   if (!p)
     return NULL;
@@ -98,6 +106,12 @@ libplumbr_t *libplumbr_new(const libplumbr_config_t *config) {
     patterns_add_defaults(p->patterns);
   }
 
+  /* Opt-in: trade construction time and memory (up to 512 bytes per
+   * state) for single-lookup transitions on the full automaton */
+  if (flags & LIBPLUMBR_FLAT_DFA) {
+    ac_set_force_flat(p->patterns->automaton);
+  }
+
   /* Build automaton */
   if (!patterns_build(p->patterns)) {
     patterns_destroy(p->patterns);
@@ -323,6 +337,105 @@ char *libplumbr_redact_buffer(libplumbr_t *p, const char *input,
   return output;
 }
 
+int libplumbr_redact_into(libplumbr_t *p, const char *input, size_t input_len,
+                          char *output, size_t output_cap, size_t *output_len) {
+  if (!p || !input || !output || !output_len)
+    return -1;
+
+  size_t out_pos = 0;
+  size_t lines = 0;
+  size_t modified = 0;
+  size_t bytes = 0;
+  bool overflow = false;
+  const char *ptr = input;
+  const char *end = input + input_len;
+  /* Matches from a call that does not succeed are rolled back */
+  size_t matched = redactor_patterns_matched(p->redactor);
+
+  while (ptr < end) {
+    /* Find end of current line */
+    const char *nl = memchr(ptr, '\n', (size_t)(end - ptr));
+    size_t line_len = nl ? (size_t)(nl - ptr) : (size_t)(end - ptr);
+
+    /* Redact this line */
+    size_t redacted_len;
+    const char *redacted =
+        redactor_process(p->redactor, ptr, line_len, &redacted_len);
+    if (redacted != ptr)
+      modified++;
+
+    /* SECURITY: Guard against overflow of the running output size */
+    size_t needed = redacted_len + (nl ? 1 : 0);
+    if (needed > SIZE_MAX - out_pos) {
+      p->redactor->patterns_matched = matched;
+      return -1;
+    }
+
+    /* Once the buffer is full, keep going only to report the size needed */
+    if (!overflow && out_pos + needed <= output_cap) {
+      memcpy(output + out_pos, redacted, redacted_len);
+      if (nl)
+        output[out_pos + redacted_len] = '\n';
+    } else {
+      overflow = true;
+    }
+    out_pos += needed;
+
+    ptr = nl ? nl + 1 : end;
+    lines++;
+    bytes += line_len;
+  }
+
+  *output_len = out_pos;
+  if (overflow) {
+    p->redactor->patterns_matched = matched;
+    return 1;
+  }
+
+  /* Update stats */
+  p->stats.lines_processed += lines;
+  p->stats.lines_modified += modified;
+  p->stats.bytes_processed += bytes;
+
+  return 0;
+}
+
+int libplumbr_redact_line_into(libplumbr_t *p, const char *input,
+                               size_t input_len, char *output,
+                               size_t output_cap, size_t *output_len) {
+  if (!p || !input || !output || !output_len)
+    return -1;
+
+  /* SECURITY: Validate input length */
+  if (input_len > PLUMBR_MAX_LINE_SIZE)
+    return -1;
+
+  size_t matched = redactor_patterns_matched(p->redactor);
+  size_t out_len;
+  const char *result =
+      redactor_process(p->redactor, input, input_len, &out_len);
+  if (!result)
+    return -1;
+
+  *output_len = out_len;
+  if (out_len > output_cap) {
+    /* Not counted: the caller retries with a larger buffer */
+    p->redactor->patterns_matched = matched;
+    return 1;
+  }
+
+  memcpy(output, result, out_len);
+
+  /* Update stats */
+  p->stats.lines_processed++;
+  p->stats.bytes_processed += input_len;
+  if (out_len != input_len || memcmp(input, output, input_len) != 0) {
+    p->stats.lines_modified++;
+  }
+
+  return 0;
+}
+
 void libplumbr_free_string(char *str) { free(str); }
 
 void libplumbr_free(libplumbr_t *p) {